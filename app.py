@@ -11,12 +11,19 @@ Based on actual Lazygit structure:
 - Green border for focused panel (ActiveBorderColor)
 """
 import csv
+import io
 import json
 import ipaddress
+import mmap
+import os
+import re
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, repeat
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
-import pyperclip
+from socket import inet_aton
 
 from textual.app import App, ComposeResult, on
 from textual.containers import Horizontal, Vertical, Container
@@ -25,7 +32,102 @@ from textual.widgets import (
     DirectoryTree
 )
 from textual import work
+from textual.coordinate import Coordinate
 from textual.reactive import reactive
+from textual.worker import get_current_worker
+
+
+# Dotted-quad with each octet range-checked (0-255, no leading zeros) by the
+# regex engine itself, so validation never raises per non-IP cell.
+_IPV4_OCTET = r"(?:25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])"
+_IPV4_PATTERN = rf"{_IPV4_OCTET}(?:\.{_IPV4_OCTET}){{3}}"
+
+# Whole-cell match for tabular input
+_IPV4_RE = re.compile(_IPV4_PATTERN)
+
+# Quote characters (and ASCII whitespace inside them) trimmed from a CSV
+# cell after str.strip() has removed any Unicode whitespace around it
+_CELL_STRIP_CHARS = " \t\r\n\"'"
+
+# File types accepted by parse_csv_safe
+_VALID_EXTENSIONS = frozenset({'.csv', '.tsv', '.txt', '.log'})
+
+# Extensions treated as free text rather than delimited tables
+_TEXT_EXTENSIONS = frozenset({'.txt', '.log'})
+
+# Free-text scan for .txt/.log input; rejects tokens glued to more digits
+# or dotted parts (e.g. "1.2.3.4.5", "1234.5.6.7"). Bytes pattern, so the
+# file never has to be decoded as a whole.
+_IPV4_SCAN_RE = re.compile(
+    rf"(?<![0-9])(?<![0-9]\.){_IPV4_PATTERN}(?![0-9]|\.[0-9])".encode('ascii')
+)
+
+# Quotes and whitespace padding a single-column cell: the UTF-8 encoding of
+# every str.isspace() character except CR and LF, which end the line
+_LINE_PAD = (
+    rb"(?:[ \t\x0b\x0c\x1c-\x1f\"']|\xc2[\x85\xa0]|\xe1\x9a\x80"
+    rb"|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]|\xe2\x81\x9f|\xe3\x80\x80)*"
+)
+
+# Whole-line match for single-column CSVs, equivalent to stripping each line
+# as a CSV cell and fullmatching _IPV4_RE (a UTF-8 BOM is skipped)
+_IPV4_LINE_RE = re.compile(
+    rb"^(?:\xef\xbb\xbf)?" + _LINE_PAD + rb"(" + _IPV4_PATTERN.encode('ascii') + rb")"
+    + _LINE_PAD + rb"\r?$",
+    re.MULTILINE,
+)
+
+# Same match for files with classic Mac (CR-only) line endings, which the
+# MULTILINE anchors above don't treat as line breaks. Lines may end in CR
+# or LF here; kept separate because the lookbehind scans slower.
+_IPV4_CR_LINE_RE = re.compile(
+    rb"(?<![^\r\n])(?:\xef\xbb\xbf)?" + _LINE_PAD + rb"(" + _IPV4_PATTERN.encode('ascii')
+    + rb")" + _LINE_PAD + rb"(?![^\r\n])"
+)
+
+# DataTable column widths: "255.255.255.255" and '"255.255.255.255/32"'
+_RAW_COLUMN_WIDTH = 15
+_TF_COLUMN_WIDTH = 20
+
+# TERM_PROGRAM values of terminals known to honour OSC 52 clipboard writes.
+# tmux is left out: it drops OSC 52 unless set-clipboard is enabled.
+_OSC52_TERMINALS = frozenset({'iTerm.app', 'WezTerm', 'vscode', 'ghostty'})
+
+# Characters read from the start of a CSV for delimiter detection. Detection
+# never looks past this sample, however large the file is.
+_SAMPLE_SIZE = 64 * 1024
+
+# Read buffer for input files; far fewer read() syscalls than the 8 KiB default
+_READ_BUFFER_SIZE = 1 << 20
+
+# CSV size from which the optional pyarrow reader is tried
+_ARROW_MIN_BYTES = 8 << 20
+
+# Candidate CSV delimiters, in tie-break order
+_DELIMITERS = ";,\t|"
+
+# Share of sampled lines a delimiter must split to be considered; a real
+# delimiter separates every row, a stray one only turns up in a few cells
+_DELIMITER_MIN_SHARE = 0.9
+
+# Parsed files whose de-duplicated IPs are kept for instant re-selection
+_PARSE_CACHE_SIZE = 8
+
+# Entries joined per write() when streaming the JSON and TXT exports
+_EXPORT_BATCH_SIZE = 10_000
+
+
+def _osc52_supported() -> bool:
+    """Whether the clipboard should be set through the terminal (OSC 52).
+
+    Over SSH the local clipboard tools pyperclip shells out to are
+    unreachable, and some terminals handle OSC 52 natively.
+    """
+    env = os.environ
+    return bool(
+        env.get('SSH_TTY') or env.get('SSH_CONNECTION') or env.get('WT_SESSION')
+        or env.get('TERM_PROGRAM') in _OSC52_TERMINALS
+    )
 
 
 class IPNormalizer(App):
@@ -52,108 +154,8 @@ class IPNormalizer(App):
     └─────────────────────────────────────────────────────┘
     """
 
-    CSS = """
-    /* ===== LAZYGIT COLOR SCHEME ===== */
-    Screen {
-        background: $background;
-    }
-
-    /* ===== HEADER ===== */
-    Header {
-        background: $primary;
-        text-style: bold;
-        padding: 0 1;
-        height: 1;
-    }
-
-    /* ===== MAIN LAYOUT ===== */
-    /* Main horizontal container */
-    #main_layout {
-        height: 1fr;
-        layout: horizontal;
-    }
-
-    /* Left side panels container */
-    #left_panels {
-        width: 35;
-        min-width: 30;
-        layout: vertical;
-    }
-
-    /* Right main panel */
-    #main_panel {
-        height: 1fr;
-    }
-
-    /* ===== PANELS ===== */
-    /* Individual panels on the left */
-    .panel {
-        border: solid $primary;
-        padding: 0;
-    }
-
-    .panel:focus {
-        border: thick green;
-    }
-
-    /* Files Panel */
-    #files_panel {
-        height: 12;
-    }
-
-    /* Raw IPs Panel */
-    #raw_panel {
-        height: 1fr;
-    }
-
-    /* Terraform Panel */
-    #tf_panel {
-        height: 1fr;
-    }
-
-    /* Main Preview Panel */
-    #preview_panel {
-        height: 1fr;
-        border: solid $primary;
-    }
-
-    #preview_panel:focus {
-        border: thick green;
-    }
-
-    /* ===== COMPONENTS ===== */
-    /* Directory tree */
-    DirectoryTree {
-        height: 1fr;
-        border: none;
-    }
-
-    /* DataTable */
-    DataTable {
-        height: 1fr;
-        border: none;
-    }
-
-    /* Preview content */
-    #preview_content {
-        height: 1fr;
-        padding: 1 2;
-    }
-
-    /* ===== BOTTOM OPTIONS BAR ===== */
-    #options_bar {
-        height: 1;
-        dock: bottom;
-        background: $panel;
-        border-top: solid $primary;
-        padding: 0 1;
-    }
-
-    #options_bar > Static {
-        text-align: center;
-        text-style: dim;
-    }
-    """
+    # Stylesheet lives next to this module; Textual loads and caches it
+    CSS_PATH = "app.tcss"
 
     BINDINGS = [
         ("1", "focus_panel('files')", "Files"),
@@ -162,23 +164,57 @@ class IPNormalizer(App):
         ("0", "focus_panel('preview')", "Preview"),
         ("tab", "cycle_panels", "Next"),
         ("p", "process_ips", "Process"),
+        ("m", "toggle_merge", "Merge"),
         ("c", "copy_result", "Copy"),
         ("s", "save_all", "Save All"),
         ("r", "refresh_tree", "Refresh"),
+        ("a", "load_all", "Load All"),
         ("q", "app.quit", "Quit"),
         ("?", "show_help", "Help"),
     ]
 
-    # Reactive state
-    raw_count = reactive(0)
-    tf_count = reactive(0)
+    # JSON export indentation; None writes compact JSON, 2 is human-readable
+    JSON_INDENT: Optional[int] = None
+
+    # Rows mounted in each table at a time (another page is appended when
+    # the cursor reaches the last row); the full lists stay in
+    # raw_ips/norm_ips for process, copy and save, so huge feeds don't
+    # stall the UI
+    MAX_DISPLAY_ROWS = 2000
+
+    # Reactive state; always_update so a reload with the same count still
+    # resets a subtitle that paging moved past the first page
+    raw_count = reactive(0, always_update=True)
+    tf_count = reactive(0, always_update=True)
 
     def __init__(self):
         super().__init__()
         self.input_file: Optional[Path] = None
         self.raw_ips: List[str] = []
+        # CIDR blocks, unquoted ("10.0.0.1/32")
         self.norm_ips: List[str] = []
 
+        # Built alongside norm_ips once per conversion and reused by
+        # preview, copy and save
+        self._tf_list_str = ""
+
+        # Collapse contiguous /32s into shorter prefixes when processing
+        self.merge_subnets = False
+
+        # (delimiter, has_header) per (path, mtime_ns, size) so re-loading an
+        # unchanged file skips delimiter detection
+        self._dialect_cache: Dict[Tuple[str, int, int], Tuple[Optional[str], bool]] = {}
+        # (unique_ips, duplicates_removed) for the most recently loaded files,
+        # same key; least recently used first
+        self._parse_cache: Dict[Tuple[str, int, int], Tuple[List[str], int]] = OrderedDict()
+
+        # Panel and table widgets by name, resolved once in on_mount so
+        # navigation and table updates skip the selector query each time
+        self._panels: Dict[str, Vertical] = {}
+        self._tables: Dict[str, DataTable] = {}
+        # Panel id -> panel that follows it in the tab cycle
+        self._next_panel: Dict[str, Vertical] = {}
+
         # Define directories
         self.input_dir = Path("input")
         self.output_dir = Path("output")
@@ -200,11 +236,11 @@ class IPNormalizer(App):
 
                 # Raw IPs Panel
                 with Vertical(id="raw_panel", classes="panel"):
-                    yield DataTable(id="raw_table")
+                    yield DataTable(id="raw_table", zebra_stripes=True)
 
                 # Terraform Panel
                 with Vertical(id="tf_panel", classes="panel"):
-                    yield DataTable(id="tf_table")
+                    yield DataTable(id="tf_table", zebra_stripes=True)
 
             # Right main panel
             with Vertical(id="preview_panel"):
@@ -218,8 +254,9 @@ Keybindings:
   2 - Raw IPs Panel  c - Copy Result
   3 - Terraform Panel s - Save JSON+TXT
   0 - Preview Panel  r - Refresh Files
-  Tab - Cycle Panels q - Quit
-  ? - Help
+  Tab - Cycle Panels m - Merge Subnets
+  a - Load All Files ? - Help
+  q - Quit
 
 Workflow:
 1. Select a CSV file from the Files panel (auto-loads)
@@ -234,7 +271,7 @@ Workflow:
         with Horizontal(id="options_bar"):
             yield Static(
                 " <1>Files  <2>Raw  <3>TF  <0>Preview │ "
-                "<p>Process  <c>Copy  <s>Save  <r>Refresh  <?>Help  <q>Quit "
+                "<p>Process  <m>Merge  <c>Copy  <s>Save  <r>Refresh  <a>All  <?>Help  <q>Quit "
             )
 
         # Footer (optional, for command palette)
@@ -242,62 +279,87 @@ Workflow:
 
     def on_mount(self) -> None:
         """Initialize UI on mount."""
+        self._panels = {
+            name: self.query_one(f"#{name}_panel", Vertical)
+            for name in ("files", "raw", "tf", "preview")
+        }
+        panels = list(self._panels.values())
+        self._next_panel = {
+            panel.id: panels[(i + 1) % len(panels)]
+            for i, panel in enumerate(panels)
+        }
+
         # Set border titles
-        self.query_one("#files_panel", Vertical).border_title = " Files"
-        self.query_one("#raw_panel", Vertical).border_title = " Raw IPs"
-        self.query_one("#tf_panel", Vertical).border_title = " Terraform /32"
-        self.query_one("#preview_panel", Vertical).border_title = " Preview"
+        self._panels["files"].border_title = " Files"
+        self._panels["raw"].border_title = " Raw IPs"
+        self._panels["tf"].border_title = self._tf_title(merged=False)
+        self._panels["preview"].border_title = " Preview"
 
         # Set up tables
-        raw_table = self.query_one("#raw_table", DataTable)
-        raw_table.add_columns("IPv4 Address")
-        raw_table.zebra_stripes = True
-
-        tf_table = self.query_one("#tf_table", DataTable)
-        tf_table.add_columns("Terraform CIDR /32")
-        tf_table.zebra_stripes = True
+        self._tables = {
+            name: self.query_one(f"#{name}_table", DataTable) for name in ("raw", "tf")
+        }
+        # Fixed-width columns skip the per-row width rescan
+        self._tables["raw"].add_column("IPv4 Address", width=_RAW_COLUMN_WIDTH)
+        self._tables["tf"].add_column(
+            self._tf_column_label(merged=False), width=_TF_COLUMN_WIDTH
+        )
 
         # Focus files panel initially
-        self.query_one("#files_panel").focus()
+        self._panels["files"].focus()
 
     def watch_raw_count(self) -> None:
-        """Update raw panel border subtitle when count changes."""
-        panel = self.query_one("#raw_panel", Vertical)
-        panel.border_subtitle = f"{self.raw_count} items"
+        """Update raw panel border subtitle whenever the count is set."""
+        if "raw" in self._panels:
+            self._panels["raw"].border_subtitle = self._items_subtitle(
+                self.raw_count, min(self.raw_count, self.MAX_DISPLAY_ROWS)
+            )
 
     def watch_tf_count(self) -> None:
-        """Update TF panel border subtitle when count changes."""
-        panel = self.query_one("#tf_panel", Vertical)
-        panel.border_subtitle = f"{self.tf_count} items"
+        """Update TF panel border subtitle whenever the count is set."""
+        if "tf" in self._panels:
+            self._panels["tf"].border_subtitle = self._items_subtitle(
+                self.tf_count, min(self.tf_count, self.MAX_DISPLAY_ROWS)
+            )
+
+    def _items_subtitle(self, count: int, shown: int) -> str:
+        """Panel subtitle for a table showing shown of count items."""
+        if shown < count:
+            return f"{count:,} items, showing {shown:,}"
+        return f"{count} items"
+
+    def on_data_table_cell_highlighted(self, event: DataTable.CellHighlighted) -> None:
+        """Append the next page of rows when the cursor reaches the last one."""
+        table = event.data_table
+        shown = table.row_count
+        if event.coordinate.row < shown - 1:
+            return
+
+        panel = "raw" if table.id == "raw_table" else "tf"
+        items = self.raw_ips if panel == "raw" else self.norm_ips
+        if shown >= len(items):
+            return
+
+        page = items[shown:shown + self.MAX_DISPLAY_ROWS]
+        if panel == "raw":
+            table.add_rows(zip(page))
+        else:
+            table.add_rows((f'"{cidr}"',) for cidr in page)
+        self._panels[panel].border_subtitle = self._items_subtitle(
+            len(items), table.row_count
+        )
 
     # ===== PANEL NAVIGATION =====
     def action_focus_panel(self, panel: str) -> None:
         """Focus a specific panel."""
-        panel_map = {
-            "files": "#files_panel",
-            "raw": "#raw_panel",
-            "tf": "#tf_panel",
-            "preview": "#preview_panel",
-        }
-        if panel in panel_map:
-            try:
-                self.query_one(panel_map[panel]).focus()
-            except Exception:
-                pass
+        if panel in self._panels:
+            self._panels[panel].focus()
 
     def action_cycle_panels(self) -> None:
         """Cycle to next panel."""
-        panels = ["#files_panel", "#raw_panel", "#tf_panel", "#preview_panel"]
-        focused = self.focused
-        if focused:
-            for i, panel_id in enumerate(panels):
-                try:
-                    if focused == self.query_one(panel_id):
-                        next_panel = panels[(i + 1) % len(panels)]
-                        self.query_one(next_panel).focus()
-                        break
-                except Exception:
-                    continue
+        next_panel = self._next_panel.get(getattr(self.focused, "id", None))
+        if next_panel is not None:
+            next_panel.focus()
 
     def action_show_help(self) -> None:
         """Show help in preview panel."""
@@ -314,9 +376,11 @@ Panel Navigation:
 
 Actions:
   p - Process: Convert raw IPs to Terraform /32 format
+  m - Merge: Toggle collapsing contiguous /32s into larger subnets
   c - Copy: Copy Terraform list to clipboard
   s - Save: Export to JSON and TXT files in output/ directory
   r - Refresh: Refresh the file browser
+  a - Load All: Load every file in input/ as one de-duplicated feed
   q - Quit: Exit the application
 
 Supported File Formats:
@@ -334,11 +398,29 @@ Press any panel key to return to work."""
     # ===== EVENT HANDLERS =====
     def on_directory_tree_file_selected(self, event) -> None:
         """Auto-load file when selected."""
-        self.input_file = event.path
         self.parse_csv_safe(event.path)
 
+    def action_load_all(self) -> None:
+        """Load every supported file in the input directory as one feed."""
+        try:
+            with os.scandir(self.input_dir) as entries:
+                paths = sorted(
+                    Path(e.path) for e in entries
+                    if e.is_file() and os.path.splitext(e.name)[1].lower() in _VALID_EXTENSIONS
+                )
+        except OSError as e:
+            self.notify(f"Load error: {e}")
+            return
+
+        if not paths:
+            self.notify("No supported files in input/!")
+            return
+
+        self.notify(f"Loading {len(paths)} files...")
+        self.parse_many(paths)
+
     # ===== CORE ACTIONS =====
-    @work(thread=True)
+    @work(thread=True, exclusive=True, group="parse")
     def parse_csv_safe(self, path: Path) -> None:
         """Parse CSV file and extract IPv4 addresses."""
         try:
@@ -346,105 +428,301 @@ Press any panel key to return to work."""
                 self.call_from_thread(self.notify, "Not a file!")
                 return
 
-            self.input_file = path
-
-            valid_extensions = {'.csv', '.tsv', '.txt', '.log'}
-            if path.suffix.lower() not in valid_extensions:
+            suffix = path.suffix.lower()
+            if suffix not in _VALID_EXTENSIONS:
                 self.call_from_thread(self.notify, "Unsupported file type!")
                 return
 
-            with open(path, 'r', newline='', encoding='utf-8-sig', errors='ignore') as f:
-                sample = f.read(4096)
-                f.seek(0)
-
-                # Detect delimiter
-                delimiter = None
-                has_header = False
-
-                try:
-                    sniffer = csv.Sniffer()
-                    dialect = sniffer.sniff(sample, delimiters=',;\t|')
-                    delimiter = dialect.delimiter
-                    has_header = sniffer.has_header(sample)
-                    reader = csv.reader(f, dialect)
-                except csv.Error:
-                    f.seek(0)
-                    for test_delim in [';', ',', '\t', '|']:
-                        f.seek(0)
-                        test_reader = csv.reader(f, delimiter=test_delim)
-                        try:
-                            rows = list(test_reader)
-                            if len(rows) >= 2:
-                                for row in rows[1:]:
-                                    for cell in row:
-                                        ipstr = cell.strip().strip('"\' ')
-                                        if ipstr:
-                                            try:
-                                                ipaddress.IPv4Address(ipstr)
-                                                delimiter = test_delim
-                                                has_header = not any(
-                                                    c.strip().replace('.', '').isdigit()
-                                                    for c in rows[0] if c.strip()
-                                                )
-                                                break
-                                            except ipaddress.AddressValueError:
-                                                pass
-                                if delimiter:
-                                    break
-                        except Exception:
-                            continue
-
-                if not delimiter:
-                    raise csv.Error("Could not determine delimiter")
-
-                f.seek(0)
-                reader = csv.reader(f, delimiter=delimiter)
-
-                # Extract IPs
-                ips = []
-                for row_idx, row in enumerate(reader):
-                    if has_header and row_idx == 0:
-                        continue
-                    for cell in row:
-                        ipstr = cell.strip().strip('"\' ')
-                        try:
-                            if ipstr:
-                                ipaddress.IPv4Address(ipstr)
-                                ips.append(ipstr)
-                        except ipaddress.AddressValueError:
-                            pass
-
-            if not ips:
-                self.call_from_thread(self.notify, "No valid IPv4 addresses found!")
+            # Re-selecting an unchanged file reuses its parsed result; pop
+            # and re-insert marks it most recently used
+            stat = path.stat()
+            cache_key = (str(path), stat.st_mtime_ns, stat.st_size)
+            cached = self._parse_cache.pop(cache_key, None)
+            if cached is not None:
+                self._parse_cache[cache_key] = cached
+                if not get_current_worker().is_cancelled:
+                    self.call_from_thread(self.update_raw_ips, *cached, path)
                 return
 
-            self.call_from_thread(self.update_raw_ips, ips)
+            # Results only appear once the whole file is parsed, so say
+            # something for files that take noticeably long
+            if stat.st_size >= _ARROW_MIN_BYTES:
+                self.call_from_thread(
+                    self.notify,
+                    f"Parsing {path.name} ({stat.st_size / (1 << 20):.1f} MiB)...",
+                )
+
+            result = self._publish_ips(self._read_ips(path), path)
+            if result is not None:
+                self._parse_cache[cache_key] = result
+                if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+                    self._parse_cache.popitem(last=False)
 
         except csv.Error as e:
             self.call_from_thread(self.notify, f"CSV error: {e}")
         except Exception as e:
             self.call_from_thread(self.notify, f"Parse error: {e}")
 
-    def update_raw_ips(self, ips: List[str]) -> None:
-        """Update the raw IPs table with deduplication."""
-        # Deduplicate while preserving order
-        seen = set()
-        unique_ips = []
-        for ip in ips:
-            if ip not in seen:
-                seen.add(ip)
-                unique_ips.append(ip)
+    @work(thread=True, exclusive=True, group="parse")
+    def parse_many(self, paths: List[Path]) -> None:
+        """Parse several files concurrently and load them as one feed."""
+        try:
+            # Arrow reads and file I/O release the GIL, so a few threads
+            # overlap them across files
+            workers = min(8, os.cpu_count() or 1, len(paths))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(self._read_ips_or_error, paths))
+
+            # One unreadable file is skipped rather than failing the batch
+            errors = [error for _, error in results if error]
+            if errors and not get_current_worker().is_cancelled:
+                self.call_from_thread(
+                    self.notify, f"Skipped {len(errors)} file(s): {'; '.join(errors)}"
+                )
+
+            self._publish_ips(
+                list(chain.from_iterable(ips for ips, _ in results)), self.input_dir
+            )
+
+        except csv.Error as e:
+            self.call_from_thread(self.notify, f"CSV error: {e}")
+        except Exception as e:
+            self.call_from_thread(self.notify, f"Parse error: {e}")
+
+    def _read_ips(self, path: Path) -> List[str]:
+        """Extract every IPv4 address from a supported file, in file order."""
+        with open(path, 'rb', buffering=_READ_BUFFER_SIZE) as f:
+            # Plain text feeds are not tabular - skip delimiter detection
+            # and csv.reader, scan the raw bytes and decode only the
+            # matches (IPs are pure ASCII)
+            if path.suffix.lower() in _TEXT_EXTENSIONS:
+                return self._scan_text_ips(f)
+            text = io.TextIOWrapper(
+                f, encoding='utf-8-sig', errors='ignore', newline=''
+            )
+            return self._extract_csv_ips(text, path)
+
+    def _read_ips_or_error(self, path: Path) -> Tuple[List[str], Optional[str]]:
+        """_read_ips for batch loads: returns (ips, error) instead of raising."""
+        try:
+            return self._read_ips(path), None
+        except Exception as e:
+            return [], f"{path.name}: {e}"
+
+    def _publish_ips(
+        self, ips: List[str], source: Path
+    ) -> Optional[Tuple[List[str], int]]:
+        """De-duplicate parsed IPs on the worker and hand them to the UI.
+
+        Returns (unique_ips, duplicates_removed), or None if there were none.
+        Nothing is shown if the parse was superseded by a newer selection.
+        """
+        if not ips:
+            if not get_current_worker().is_cancelled:
+                self.call_from_thread(self.notify, "No valid IPv4 addresses found!")
+            return None
+
+        # Deduplicate while preserving order, still on the worker thread.
+        # The strict pattern only accepts canonical dotted quads, so
+        # string equality is address equality.
+        unique_ips = list(dict.fromkeys(ips))
+        result = (unique_ips, len(ips) - len(unique_ips))
+
+        # exclusive=True only flags a running parse cancelled; its result is
+        # still cached, but must not replace the newer selection's feed
+        if not get_current_worker().is_cancelled:
+            self.call_from_thread(self.update_raw_ips, *result, source)
+        return result
+
+    def _scan_text_ips(self, f, pattern: re.Pattern = _IPV4_SCAN_RE) -> List[str]:
+        """Scan an open binary file for IPv4 addresses via a memory map."""
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+
+        # The regex runs directly over the mapped pages, so the file is
+        # never copied into a Python bytes object
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return [ip.decode('ascii') for ip in pattern.findall(mm)]
+
+    def _extract_csv_ips(self, f, path: Path) -> List[str]:
+        """Detect the delimiter of an open CSV file and extract IPv4 cells."""
+        stat = path.stat()
+        cache_key = (str(path), stat.st_mtime_ns, stat.st_size)
+        if cache_key in self._dialect_cache:
+            delimiter, has_header = self._dialect_cache[cache_key]
+        else:
+            # A .tsv is tab-separated by definition; only ask whether it
+            # actually has more than one column
+            candidates = '\t' if path.suffix.lower() == '.tsv' else _DELIMITERS
+            delimiter, has_header = self._detect_dialect(f, candidates)
+            self._dialect_cache[cache_key] = (delimiter, has_header)
+
+        # Single column: every line is one cell, so match whole lines in
+        # one regex pass over the raw bytes instead of tokenizing rows
+        if delimiter is None:
+            f.buffer.seek(0)
+            head = f.buffer.read(_SAMPLE_SIZE)
+            cr_only = b'\r' in head and b'\n' not in head
+            return self._scan_text_ips(
+                f.buffer, _IPV4_CR_LINE_RE if cr_only else _IPV4_LINE_RE
+            )
+
+        # Large files go through pyarrow's C++ reader when it is available
+        if stat.st_size >= _ARROW_MIN_BYTES:
+            ips = self._extract_csv_ips_arrow(path, delimiter, has_header)
+            if ips is not None:
+                return ips
+
+        f.seek(0)
+        reader = csv.reader(f, delimiter=delimiter)
+
+        if has_header:
+            next(reader, None)
+
+        # Extract IPs: one flat pass over every cell, with iteration, strip
+        # and match all driven from C (no nested Python for-loops)
+        cells = map(
+            str.strip, map(str.strip, chain.from_iterable(reader)), repeat(_CELL_STRIP_CHARS)
+        )
+        return list(filter(_IPV4_RE.fullmatch, cells))
+
+    def _extract_csv_ips_arrow(
+        self, path: Path, delimiter: str, has_header: bool
+    ) -> Optional[List[str]]:
+        """Extract IPv4 cells with pyarrow's CSV reader, keeping row order.
+
+        Returns None when pyarrow is not installed or cannot read the file
+        (ragged rows, a column with invalid UTF-8, ...) so the caller can
+        fall back to csv.reader.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+            import pyarrow.csv as pa_csv
+        except ImportError:
+            return None
+
+        try:
+            table = pa_csv.read_csv(
+                path,
+                read_options=pa_csv.ReadOptions(
+                    skip_rows=1 if has_header else 0,
+                    autogenerate_column_names=True,
+                ),
+                parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+            )
+        except pa.ArrowInvalid:
+            return None
+
+        # Validate column by column, then restore row-major order with a
+        # row * num_columns + column sort key
+        keys, values = [], []
+        for col_idx, column in enumerate(table.columns):
+            if pa.types.is_binary(column.type) or pa.types.is_large_binary(column.type):
+                # Arrow types a column holding invalid UTF-8 as binary;
+                # csv.reader decodes it leniently instead
+                return None
+            if not (pa.types.is_string(column.type) or pa.types.is_large_string(column.type)):
+                continue  # Inferred numeric/temporal columns hold no IPs
+            cells = pc.utf8_trim(
+                pc.utf8_trim_whitespace(column), characters=_CELL_STRIP_CHARS
+            )
+            mask = pc.match_substring_regex(cells, f"^{_IPV4_PATTERN}$")
+            rows = pc.indices_nonzero(mask)
+            if not len(rows):
+                continue
+            keys.append(pc.add(pc.multiply(rows, table.num_columns), col_idx))
+            values.extend(pc.filter(cells, mask).chunks)
+
+        if not values:
+            return []
+
+        order = pc.sort_indices(pa.concat_arrays(keys))
+        return pa.concat_arrays(values).take(order).to_pylist()
+
+    def _detect_dialect(self, f, delimiters: str = _DELIMITERS) -> Tuple[Optional[str], bool]:
+        """Detect (delimiter, has_header) of an open CSV file.
+
+        Only the given candidate delimiters are tried. The delimiter is
+        None for a single-column file.
+        """
+        sample = f.read(_SAMPLE_SIZE)
+        f.seek(0)
+
+        delimiter = None
+        has_header = False
+
+        # One substring search per candidate rules out delimiters absent
+        # from the sample before any per-line counting
+        candidates = [c for c in delimiters if c in sample]
+
+        # Pick the candidate that splits the most lines into the same number
+        # of fields, counting only delimiters outside quotes. The header line
+        # is excluded from scoring, as is the last line when the sample may
+        # have cut it off.
+        lines = [ln for ln in sample.splitlines() if ln.strip()]
+        scored = lines[1:-1] if len(sample) == _SAMPLE_SIZE else lines[1:]
+        scored = scored or lines
+        best_score = None
+        for candidate in candidates:
+            counts = [len(row) - 1 for row in csv.reader(scored, delimiter=candidate)]
+            present = [c for c in counts if c]
+            if len(present) < _DELIMITER_MIN_SHARE * len(counts):
+                continue
+            mode, hits = Counter(present).most_common(1)[0]
+            score = (hits, mode)
+            if best_score is None or score > best_score:
+                best_score = score
+                delimiter = candidate
+
+        if delimiter:
+            first_row = next(csv.reader(lines[:1], delimiter=delimiter), [])
+            has_header = not any(
+                c.strip().replace('.', '').isdigit()
+                for c in first_row if c.strip()
+            )
 
+        return delimiter, has_header
+
+    def _set_table_rows(self, table: DataTable, cells: List[str]) -> None:
+        """Replace a single-column table's rows with cells.
+
+        Rows that already exist are rewritten in place, which is about 3x
+        cheaper than clearing and re-adding them; only a shrinking table
+        is cleared.
+        """
+        with self.batch_update():
+            reused = table.row_count
+            if len(cells) < reused:
+                table.clear()
+                reused = 0
+            for row, cell in enumerate(cells[:reused]):
+                table.update_cell_at(Coordinate(row, 0), cell)
+            # zip() over one list yields the 1-tuple rows without a genexpr
+            table.add_rows(zip(cells[reused:]))
+            table.move_cursor(row=0, column=0)
+
+    def update_raw_ips(
+        self, unique_ips: List[str], duplicates_removed: int = 0,
+        source: Optional[Path] = None,
+    ) -> None:
+        """Update the raw IPs table with already de-duplicated IPs from source."""
+        if source is not None:
+            self.input_file = source
         self.raw_ips = unique_ips
         self.raw_count = len(unique_ips)
-        duplicates_removed = len(ips) - len(unique_ips)
 
-        table = self.query_one("#raw_table", DataTable)
-        table.clear()
-        table.add_columns("IPv4 Address")
+        # Results of the previous feed no longer match raw_ips; drop them
+        # (and any conversion still running) so copy and save refuse until
+        # the new feed is processed
+        self.workers.cancel_group(self, "process")
+        self.norm_ips = []
+        self._tf_list_str = ""
+        self.tf_count = 0
+        self._tables["tf"].clear()
 
-        for ip in unique_ips:
-            table.add_row(ip)
+        table = self._tables["raw"]
+        self._set_table_rows(table, unique_ips[:self.MAX_DISPLAY_ROWS])
 
         table.focus()
 
@@ -463,15 +741,70 @@ Press any panel key to return to work."""
             self.notify("No raw IPs to process!")
             return
 
-        self.norm_ips = [f'"{ip}/32"' for ip in self.raw_ips]
-        self.tf_count = len(self.norm_ips)
+        self.convert_to_cidr(self.raw_ips, self.merge_subnets)
+
+    def action_toggle_merge(self) -> None:
+        """Toggle collapsing contiguous /32 blocks into larger subnets."""
+        self.merge_subnets = not self.merge_subnets
+        self.notify(f"Subnet merge: {'on' if self.merge_subnets else 'off'}")
+
+        # Re-process so the Terraform panel reflects the new mode
+        if self.norm_ips:
+            self.convert_to_cidr(self.raw_ips, self.merge_subnets)
+
+    @work(thread=True, exclusive=True, group="process")
+    def convert_to_cidr(self, ips: List[str], merge: bool = False) -> None:
+        """Build the CIDR lists and Terraform string off the UI thread."""
+        if merge:
+            # IPs are already validated; build addresses from packed ints
+            # rather than re-parsing each dotted string in Python
+            nets = ipaddress.collapse_addresses(
+                ipaddress.IPv4Address(int.from_bytes(inet_aton(ip), "big"))
+                for ip in ips
+            )
+            cidr_blocks = [str(net) for net in nets]
+        else:
+            cidr_blocks = [f"{ip}/32" for ip in ips]
 
-        table = self.query_one("#tf_table", DataTable)
-        table.clear()
-        table.add_columns("Terraform CIDR /32")
+        # Quote by joining on '","' rather than building a quoted copy of
+        # every block; the string is shared by preview, copy and save
+        tf_list = '["' + '","'.join(cidr_blocks) + '"]' if cidr_blocks else "[]"
 
-        for cidr in self.norm_ips:
-            table.add_row(cidr)
+        # exclusive=True only marks a running thread worker cancelled; a
+        # superseded conversion must not overwrite the newer result
+        if get_current_worker().is_cancelled:
+            return
+        self.call_from_thread(self.update_norm_ips, cidr_blocks, tf_list, merge)
+
+    @staticmethod
+    def _tf_title(merged: bool) -> str:
+        """Terraform panel title; merged results mix prefix lengths."""
+        return " Terraform CIDR" if merged else " Terraform /32"
+
+    @staticmethod
+    def _tf_column_label(merged: bool) -> str:
+        """Terraform table column header for merged or /32 results."""
+        return "Terraform CIDR" if merged else "Terraform CIDR /32"
+
+    def update_norm_ips(
+        self, cidr_blocks: List[str], tf_list: str, merged: bool = False
+    ) -> None:
+        """Update the Terraform table with converted CIDR blocks."""
+        self.norm_ips = cidr_blocks
+        self._tf_list_str = tf_list
+        self.tf_count = len(cidr_blocks)
+
+        table = self._tables["tf"]
+        title = self._tf_title(merged)
+        if self._panels["tf"].border_title != title:
+            self._panels["tf"].border_title = title
+            # Column labels are fixed once added; rebuild the column
+            table.clear(columns=True)
+            table.add_column(self._tf_column_label(merged), width=_TF_COLUMN_WIDTH)
+        # Only the displayed rows get the quoted Terraform form
+        self._set_table_rows(
+            table, [f'"{cidr}"' for cidr in cidr_blocks[:self.MAX_DISPLAY_ROWS]]
+        )
 
         table.focus()
         self.notify(f"Processed {len(self.norm_ips)} CIDR blocks")
@@ -505,7 +838,7 @@ Press p to convert to Terraform /32 format"""
     def update_preview_with_results(self) -> None:
         """Update preview with Terraform results."""
         preview = self.query_one("#preview_content", Static)
-        tf_list = f"[{','.join(self.norm_ips)}]"
+        tf_list = self._tf_list_str
         preview_list = tf_list[:100] + ('...' if len(tf_list) > 100 else '')
 
         preview.update(
@@ -529,12 +862,40 @@ Ready to use in your Terraform configuration!"""
             self.notify("No results to copy!")
             return
 
+        # OSC 52 is a single terminal write; pyperclip spawns xclip/pbcopy
+        if _osc52_supported():
+            self.copy_to_clipboard(self._tf_list_str)
+            # The terminal never acknowledges the write, so don't claim success
+            self.notify(f"Sent {len(self.norm_ips)} CIDR blocks to terminal clipboard (OSC 52)")
+            return
+
+        # xclip/pbcopy can take a while on large lists; keep it off the UI
+        self.copy_with_pyperclip(self._tf_list_str, len(self.norm_ips))
+
+    @work(thread=True, exclusive=True, group="copy")
+    def copy_with_pyperclip(self, payload: str, count: int) -> None:
+        """Copy payload through pyperclip on a worker thread."""
         try:
-            tf_list = f"[{','.join(self.norm_ips)}]"
-            pyperclip.copy(tf_list)
-            self.notify(f"Copied {len(self.norm_ips)} CIDR blocks!")
+            # Imported on first use: pyperclip probes for clipboard tools at
+            # import time, which startup shouldn't pay for
+            import pyperclip
+            pyperclip.copy(payload)
+            self.call_from_thread(self.notify, f"Copied {count} CIDR blocks!")
+        except ImportError:
+            # pyperclip not installed, let the terminal try instead
+            self._copy_via_terminal(payload, count)
+        except pyperclip.PyperclipException:
+            # No clipboard tool available, let the terminal try instead
+            self._copy_via_terminal(payload, count)
         except Exception as e:
-            self.notify(f"Copy failed: {e}")
+            self.call_from_thread(self.notify, f"Copy failed: {e}")
+
+    def _copy_via_terminal(self, payload: str, count: int) -> None:
+        """Fall back to an OSC 52 copy from a worker thread."""
+        self.call_from_thread(self.copy_to_clipboard, payload)
+        self.call_from_thread(
+            self.notify, f"Sent {count} CIDR blocks to terminal clipboard (OSC 52)"
+        )
 
     def action_save_all(self) -> None:
         """Export results to JSON and TXT formats."""
@@ -542,49 +903,96 @@ Ready to use in your Terraform configuration!"""
             self.notify("No results to save!")
             return
 
+        # The lists are replaced on reload, never mutated, so the worker can
+        # keep using these references
+        self.save_exports(self.input_file, self.raw_ips, self.norm_ips)
+
+    @work(thread=True, group="save")
+    def save_exports(
+        self, input_file: Optional[Path], raw_ips: List[str], cidr_blocks: List[str]
+    ) -> None:
+        """Write the JSON and TXT exports off the UI thread."""
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            source_name = self.input_file.name if self.input_file else "unknown"
+            source_name = input_file.name if input_file else "unknown"
 
             # Save JSON export
-            cidr_blocks_clean = [f"{ip}/32" for ip in self.raw_ips]
-
-            # cidr_blocks_form1: horizontal with quotes ["192.168.1.1/32", "10.0.0.1/32", ...]
-            cidr_blocks_form1 = cidr_blocks_clean
-
-            # cidr_blocks_form2: horizontal without quotes [192.168.1.1/32, 10.0.0.1/32, ...]
-            cidr_blocks_form2_str = f"[{', '.join(cidr_blocks_clean)}]"
-
-            data = {
+            header = {
                 "export_timestamp": datetime.now().isoformat(),
-                "source_file": str(self.input_file) if self.input_file else "unknown",
+                "source_file": str(input_file) if input_file else "unknown",
                 "source_name": source_name,
-                "ipv4_count": len(self.norm_ips),
-                "terraform_list": f"[{','.join(self.norm_ips)}]",
-                "cidr_blocks_form1": cidr_blocks_form1,
-                "cidr_blocks_form2": cidr_blocks_form2_str
+                "ipv4_count": len(raw_ips),
+                "cidr_block_count": len(cidr_blocks),
             }
 
-            json_filename = f"terraform_iocs_{len(self.norm_ips)}_{timestamp}.json"
+            json_filename = f"terraform_iocs_{len(raw_ips)}_{timestamp}.json"
             json_output_path = self.output_dir / json_filename
-            json_output_path.write_text(json.dumps(data, indent=2))
+            self._write_json_export(json_output_path, header, cidr_blocks)
 
             # Save TXT export (plain text, one IP per line)
-            txt_filename = f"terraform_iocs_{len(self.norm_ips)}_{timestamp}.txt"
+            txt_filename = f"terraform_iocs_{len(raw_ips)}_{timestamp}.txt"
             txt_output_path = self.output_dir / txt_filename
-            txt_content = "\n".join(self.raw_ips)
-            txt_output_path.write_text(txt_content)
-
-            self.notify(f"Saved: output/{json_filename} & output/{txt_filename}")
+            with txt_output_path.open('w', encoding='utf-8', buffering=1 << 20) as f:
+                for start in range(0, len(raw_ips), _EXPORT_BATCH_SIZE):
+                    if start:
+                        f.write("\n")
+                    f.write("\n".join(raw_ips[start:start + _EXPORT_BATCH_SIZE]))
+
+            self.call_from_thread(
+                self.notify, f"Saved: output/{json_filename} & output/{txt_filename}"
+            )
 
         except Exception as e:
-            self.notify(f"Save failed: {e}")
+            self.call_from_thread(self.notify, f"Save failed: {e}")
+
+    def _write_json_export(
+        self, path: Path, header: Dict[str, object], cidr_blocks: List[str]
+    ) -> None:
+        """Write the JSON export, streaming the CIDR list fields in batches.
+
+        Produces the same document as json.dump with JSON_INDENT, but never
+        builds the encoded lists in memory. CIDR strings are only digits,
+        dots and a slash, so they are written without JSON escaping.
+        """
+        indent = self.JSON_INDENT
+        if indent is None:
+            newline, pad, colon = "", "", ":"
+        else:
+            newline, pad, colon = "\n", " " * indent, ": "
+        item_pad = newline + pad * 2
+
+        # (key, opening, separator, closing) for each list field:
+        # terraform_list: string holding a quoted HCL list "[\"a/32\",\"b/32\"]"
+        # cidr_blocks_form1: horizontal with quotes ["192.168.1.1/32", "10.0.0.1/32", ...]
+        # cidr_blocks_form2: horizontal without quotes [192.168.1.1/32, 10.0.0.1/32, ...]
+        list_fields = (
+            ("terraform_list", '"[\\"', '\\",\\"', '\\"]"'),
+            ("cidr_blocks_form1", f'[{item_pad}"', f'",{item_pad}"', f'"{newline}{pad}]'),
+            ("cidr_blocks_form2", '"[', ', ', ']"'),
+        )
+
+        with path.open('w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write("{" + newline)
+            for key, value in header.items():
+                f.write(f"{pad}{json.dumps(key)}{colon}{json.dumps(value)},{newline}")
+            for i, (key, opening, separator, closing) in enumerate(list_fields):
+                if i:
+                    f.write("," + newline)
+                f.write(f'{pad}"{key}"{colon}{opening}')
+                for start in range(0, len(cidr_blocks), _EXPORT_BATCH_SIZE):
+                    if start:
+                        f.write(separator)
+                    f.write(separator.join(cidr_blocks[start:start + _EXPORT_BATCH_SIZE]))
+                f.write(closing)
+            f.write(newline + "}")
 
     def action_refresh_tree(self) -> None:
         """Refresh the directory tree hanya jika ada perubahan."""
         try:
             # Get current file list dan buat set untuk comparison
-            current_files = set(f.name for f in self.input_dir.iterdir() if f.is_file())
+            # scandir memakai d_type dari readdir, tanpa stat() per file
+            with os.scandir(self.input_dir) as entries:
+                current_files = {e.name for e in entries if e.is_file()}
 
             # Get previous file list dari state atau buat set kosong jika belum ada
             if not hasattr(self, '_previous_files'):
@@ -599,39 +1007,11 @@ Ready to use in your Terraform configuration!"""
                 self.notify("Tidak ada perubahan file")
                 return
 
-            # Ada perubahan, lanjutkan refresh
-            # Get tree container dan children
-            tree_container = self.query_one("#files_panel", Vertical)
-            children = tree_container.children
-
-            # Save current cursor position dari DirectoryTree manapun yang ada
-            cursor_path = None
-            for child in children:
-                if isinstance(child, DirectoryTree):
-                    if child.cursor_node and child.cursor_node.data:
-                        cursor_path = str(child.cursor_node.data.path)
-                    break
-
-            # Remove semua DirectoryTree yang ada di container
-            for child in list(children):  # Use list() to avoid modification during iteration
-                if isinstance(child, DirectoryTree):
-                    child.remove()
-
-            # Create new tree dengan ID yang selalu sama "dir_tree"
-            # Setelah old tree di-remove, ID ini aman digunakan
-            new_tree = DirectoryTree(str(self.input_dir), id="dir_tree")
-            tree_container.mount(new_tree)
-
-            # Focus pada new tree
-            new_tree.focus()
-
-            # Restore cursor position jika ada
-            if cursor_path and Path(cursor_path).exists():
-                try:
-                    new_tree.cursor_path = cursor_path
-                except Exception:
-                    # Path tidak ada di tree baru, silent fail
-                    pass
+            # Ada perubahan, reload tree di tempat (tanpa remove + mount)
+            # Cursor dan expanded nodes tetap dipertahankan oleh DirectoryTree
+            tree = self.query_one("#dir_tree", DirectoryTree)
+            tree.reload()
+            tree.focus()
 
             # Update state dengan file list saat ini
             self._previous_files = current_files
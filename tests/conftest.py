@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# app.py is a top-level script, not an installed package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,174 @@
+"""Parsing and export checks for app.py.
+
+Expected IP lists are what the original csv.Sniffer + ipaddress parser
+returned for the same input, in file order and before de-duplication,
+except where behaviour changed on purpose: .txt/.log feeds are scanned as
+free text, and an empty file yields no IPs instead of a CSV error.
+"""
+import io
+import ipaddress
+import json
+
+import pytest
+
+import app
+
+
+@pytest.fixture
+def normalizer():
+    return app.IPNormalizer()
+
+
+def write(tmp_path, name, data):
+    path = tmp_path / name
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    path.write_bytes(data)
+    return path
+
+
+# ===== VALIDATION =====
+@pytest.mark.parametrize("cell", [
+    "0.0.0.0", "1.2.3.4", "10.0.0.1", "192.168.1.100", "255.255.255.255",
+    "256.1.1.1", "01.2.3.4", "1.2.3", "1.2.3.4.5", "1.2.3.-4", "1.2.3.4 ",
+    "", "a.b.c.d", "1..2.3", "999.0.0.0", "1.2.3.04",
+])
+def test_ipv4_regex_matches_ipaddress(cell):
+    try:
+        ipaddress.IPv4Address(cell)
+        expected = True
+    except ipaddress.AddressValueError:
+        expected = False
+    assert bool(app._IPV4_RE.fullmatch(cell)) is expected
+
+
+# ===== DIALECT DETECTION =====
+@pytest.mark.parametrize("sample, expected", [
+    ("ip,port\n1.1.1.1,80\n2.2.2.2,443\n", (",", True)),
+    ("1.1.1.1;x\n2.2.2.2;y\n", (";", False)),
+    ("ip\tnote\n1.1.1.1\ta,b\n2.2.2.2\tc\n", ("\t", True)),
+    ("ip|note\n1.1.1.1|a,b\n2.2.2.2|c\n", ("|", True)),
+    ("1.1.1.1\n2.2.2.2\n", (None, False)),
+])
+def test_detect_dialect(normalizer, sample, expected):
+    assert normalizer._detect_dialect(io.StringIO(sample)) == expected
+
+
+def test_detect_dialect_ignores_quoted_and_stray_delimiters(normalizer):
+    rows = ["name,ip,port"]
+    for i in range(100):
+        name = '"Doe, John"' if i % 10 == 0 else f"host{i}"
+        rows.append(f"{name},10.0.0.{i},80")
+    rows.insert(50, "a;b,10.1.1.1,1")
+    sample = "\n".join(rows) + "\n"
+    assert normalizer._detect_dialect(io.StringIO(sample)) == (",", True)
+
+
+# ===== FILE PARSING =====
+@pytest.mark.parametrize("name, data, expected", [
+    (
+        "multi.csv",
+        "timestamp,src_ip,dst_ip,action\n"
+        "2024-01-15T10:00:00,192.168.1.100,10.0.0.1,TCP\n"
+        "2024-01-15T10:00:01,invalid-ip,8.8.8.8,UDP\n",
+        ["192.168.1.100", "10.0.0.1", "8.8.8.8"],
+    ),
+    (
+        "quoted.csv",
+        'name,ip\n"Doe, John","1.1.1.1"\n"Roe, Jane", 2.2.2.2 \n',
+        ["1.1.1.1", "2.2.2.2"],
+    ),
+    (
+        "semi.csv",
+        "IP Address;note\n8.8.8.8;x\n8.8.4.4;y\n1.1.1.1;z\n",
+        ["8.8.8.8", "8.8.4.4", "1.1.1.1"],
+    ),
+    ("tab.tsv", "a\tb\n1.1.1.1\tx;y\n2.2.2.2\tz\n", ["1.1.1.1", "2.2.2.2"]),
+    ("bom.csv", b"\xef\xbb\xbf5.5.5.5,a\n6.6.6.6,b\n", ["5.5.5.5", "6.6.6.6"]),
+    ("nbsp.csv", "\xa01.2.3.4,a\n 2.2.2.2　,b\n", ["1.2.3.4", "2.2.2.2"]),
+    ("lf.csv", "1.2.3.4\n'5.6.7.8'\n256.0.0.1\n1.2.3.4\n", ["1.2.3.4", "5.6.7.8", "1.2.3.4"]),
+    ("crlf.csv", "1.2.3.4\r\n 5.6.7.8 \r\nfoo\r\n", ["1.2.3.4", "5.6.7.8"]),
+    ("cr.csv", "1.2.3.4\r5.6.7.8\r", ["1.2.3.4", "5.6.7.8"]),
+    ("single_nbsp.csv", '\xa01.2.3.4\n"2.2.2.2"　\n', ["1.2.3.4", "2.2.2.2"]),
+    (
+        "feed.txt",
+        "1.2.3.4\nfoo 10.0.0.1 bar\n256.1.1.1\n1.2.3.4\n01.2.3.4\n9.9.9.9.\n",
+        ["1.2.3.4", "10.0.0.1", "1.2.3.4", "9.9.9.9"],
+    ),
+    ("crlf.log", b"\xef\xbb\xbf5.5.5.5\r\n6.6.6.6\r\n", ["5.5.5.5", "6.6.6.6"]),
+    ("empty.csv", b"", []),
+    ("empty.txt", b"", []),
+    ("invalid.csv", b"ip,n\n1.1.1.1\xff,a\n2.2.2.2,b\xfe\n", ["1.1.1.1", "2.2.2.2"]),
+])
+def test_read_ips(normalizer, tmp_path, name, data, expected):
+    assert normalizer._read_ips(write(tmp_path, name, data)) == expected
+
+
+def large_csv(rows, bad_byte=False):
+    lines = [b"ip,host,note"]
+    for i in range(rows):
+        ip = b"10.%d.%d.%d" % (i >> 16 & 255, i >> 8 & 255, i & 255)
+        if bad_byte and i == 5:
+            ip += b"\xff"
+        lines.append(b"%s,host%d.example.com,\"seen, twice\"" % (ip, i))
+    return b"\n".join(lines) + b"\n"
+
+
+@pytest.mark.parametrize("bad_byte", [False, True])
+def test_large_csv_arrow_matches_csv_reader(normalizer, tmp_path, monkeypatch, bad_byte):
+    pytest.importorskip("pyarrow")
+    path = write(tmp_path, "large.csv", large_csv(40_000, bad_byte))
+    assert path.stat().st_size >= 1 << 20
+
+    monkeypatch.setattr(app, "_ARROW_MIN_BYTES", 1 << 40)
+    expected = normalizer._read_ips(path)
+    assert len(expected) == 40_000
+
+    monkeypatch.setattr(app, "_ARROW_MIN_BYTES", 1 << 20)
+    assert normalizer._read_ips(path) == expected
+    # Invalid UTF-8 is left to csv.reader rather than dropped by Arrow
+    arrow = normalizer._extract_csv_ips_arrow(path, ",", True)
+    assert arrow == (None if bad_byte else expected)
+
+
+def test_large_csv_without_ips(normalizer, tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    body = "host,desc\n" + "".join(
+        f"host{i}.example.com,some description {i}\n" for i in range(50_000)
+    )
+    path = write(tmp_path, "noip.csv", body)
+    assert path.stat().st_size >= 1 << 20
+
+    monkeypatch.setattr(app, "_ARROW_MIN_BYTES", 1 << 20)
+    assert normalizer._extract_csv_ips_arrow(path, ",", True) == []
+    assert normalizer._read_ips(path) == []
+
+
+# ===== EXPORT =====
+@pytest.mark.parametrize("count", [1, 3, 4, 7])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_json_export_matches_json_dumps(normalizer, tmp_path, monkeypatch, count, indent):
+    monkeypatch.setattr(app, "_EXPORT_BATCH_SIZE", 3)
+    normalizer.JSON_INDENT = indent
+    blocks = [f"10.0.0.{i}/32" for i in range(count)]
+    header = {
+        "export_timestamp": "2024-01-15T10:30:00",
+        "source_file": "input/é.csv",
+        "source_name": "é.csv",
+        "ipv4_count": count,
+        "cidr_block_count": count,
+    }
+    path = tmp_path / "export.json"
+    normalizer._write_json_export(path, header, blocks)
+
+    document = dict(
+        header,
+        terraform_list="[" + ",".join(f'"{b}"' for b in blocks) + "]",
+        cidr_blocks_form1=blocks,
+        cidr_blocks_form2=f"[{', '.join(blocks)}]",
+    )
+    if indent is None:
+        expected = json.dumps(document, separators=(',', ':'))
+    else:
+        expected = json.dumps(document, indent=indent)
+    assert path.read_text(encoding='utf-8') == expected